@@ -0,0 +1,3 @@
+"""
+Application package for the Experiment Hub backend.
+"""
@@ -0,0 +1,70 @@
+"""
+Cache module for the Experiment Hub application.
+
+Provides a small in-process TTL cache used cache-aside by the hot read
+endpoints, with explicit invalidation on the write paths.
+"""
+import time
+from typing import Any, Optional
+
+
+class TTLCache:
+    """
+    Dictionary-backed cache where entries expire after a fixed TTL.
+
+    Entries are evicted lazily on lookup and oldest-first when the cache
+    is full. Sized for a single-process deployment; all invalidation is
+    explicit via delete/delete_prefix on the write paths.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expires_at, value); insertion-ordered for simple eviction
+        self._entries: dict = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value under key, expiring after ttl seconds (default TTL
+        of the cache if not given).
+        """
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            # Evict the oldest entry; good enough for a small hot-key cache
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + (ttl or self.ttl), value)
+
+    def delete(self, *keys: str) -> None:
+        """
+        Remove the given keys if present.
+        """
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Remove every key starting with prefix (e.g. a whole list-view
+        family such as "experiments:list:").
+        """
+        stale = [key for key in self._entries if key.startswith(prefix)]
+        for key in stale:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop all cached entries.
+        """
+        self._entries.clear()
@@ -6,7 +6,7 @@ for database operations.
 """
 import os
 from datetime import datetime
-from typing import Generator
+from typing import AsyncGenerator
 
 from sqlalchemy import (
     JSON,
@@ -14,35 +14,70 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
-    create_engine,
+    event,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
-
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./experiment_db.sqlite")
-
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from sqlalchemy.orm import relationship
+
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./experiment_db.sqlite")
+
+# pool_pre_ping revalidates pooled connections before handing them out, so
+# long-lived training jobs never pick up a connection that has gone stale.
+engine = create_async_engine(DATABASE_URL, pool_pre_ping=True)
+
+
+if DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, connection_record) -> None:
+        """
+        Tune SQLite for concurrent access on every new connection.
+
+        WAL mode lets readers proceed while the training job writes, and
+        synchronous=NORMAL drops the per-commit fsync that dominates the
+        cost of frequent status updates. The remaining pragmas enlarge the
+        page cache and keep temporary structures in memory.
+        """
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+
+SessionLocal = async_sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
 Base = declarative_base()
 
 
 # Database dependency
-def get_db() -> Generator:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for database session management.
 
     Yields:
-        db: Database session that will be automatically closed after use.
+        db: Async database session that will be automatically closed after use.
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # Database models
@@ -66,6 +101,7 @@ class Experiment(Base):  # type: ignore
         "Job",
         back_populates="experiment",
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
 
 
@@ -78,34 +114,74 @@ class Job(Base):  # type: ignore
     """
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_exp_model", "experiment_id", "model_type"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    job_id = Column(String, unique=True, index=True)
-    experiment_id = Column(Integer, ForeignKey("experiments.id"))
+    # Raw 16-byte UUID; half the key size of the hyphenated string form,
+    # so the unique index packs twice as many keys per B-tree page.
+    # Externally the id travels as 32-char hex (see schemas.JobResponse).
+    job_id = Column(LargeBinary(16), unique=True, index=True)
+    experiment_id = Column(Integer, ForeignKey("experiments.id"), index=True)
     name = Column(String, nullable=False)
-    status = Column(String, default="pending")  # pending, running, completed, failed
+    # pending, running, completed, failed
+    status = Column(String, default="pending", index=True)
     model_type = Column(String, nullable=False)
     parameters = Column(JSON, nullable=False)
+    # Canonical hash over the duplicate-defining parameters, so duplicate
+    # detection is a single indexed lookup (see main.compute_params_hash)
+    params_hash = Column(String, index=True)
 
     # Results
     best_accuracy = Column(Float, nullable=True)
     total_time = Column(Float, nullable=True)
     epochs_completed = Column(Integer, default=0)
-    history = Column(JSON, nullable=True)
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
 
-    experiment = relationship("Experiment", back_populates="jobs")
+    experiment = relationship("Experiment", back_populates="jobs", lazy="joined")
+    # Metric rows are written append-only by the training callback and only
+    # read by the history endpoints, so they are never loaded implicitly;
+    # passive_deletes lets the database cascade handle cleanup.
+    epoch_metrics = relationship(
+        "JobEpochMetric",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="noload",
+    )
+
+
+class JobEpochMetric(Base):  # type: ignore
+    """
+    Per-epoch training metrics for a job, one row per completed epoch.
+
+    Replaces the former monolithic history JSON blob on the Job row:
+    appending a row per epoch is O(1) per epoch, where rewriting the
+    growing JSON document was quadratic over a long run.
+    """
+
+    __tablename__ = "job_epoch_metrics"
+
+    job_id = Column(
+        Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    epoch = Column(Integer, primary_key=True)
+    train_loss = Column(Float, nullable=True)
+    train_accuracy = Column(Float, nullable=True)
+    val_loss = Column(Float, nullable=True)
+    val_accuracy = Column(Float, nullable=True)
+    epoch_time = Column(Float, nullable=True)
 
 
 # Create tables
-def init_db() -> None:
+async def init_db() -> None:
     """
     Initialize database tables.
 
     Creates all tables defined by the Base metadata if they don't exist yet.
     """
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
@@ -1,23 +1,66 @@
 from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse, Response
+import orjson
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 import asyncio
+import hashlib
+import logging
+import os
 import uuid
 import json
-import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from app.database import get_db, init_db, Job, Experiment
+from app.cache import TTLCache
+from app.database import get_db, init_db, SessionLocal, Job, JobEpochMetric, Experiment
 from app.schemas import ExperimentCreate, ExperimentResponse, JobCreate, JobResponse, JobWithHistory, JobStatusUpdate
 from models.mnist_model import create_model
 from models.trainer import train_model
 
-# Create FastAPI app
-app = FastAPI(title="Experiment Hub API")
+logger = logging.getLogger(__name__)
+
+
+# Parameter keys that define a duplicate job. Parameters outside these sets
+# (e.g. CNN dropout_rate) are allowed to differ without making a duplicate.
+CORE_PARAM_KEYS = ("optimizer", "learning_rate", "batch_size", "epochs")
+MODEL_PARAM_KEYS = {
+    "mlp": ("hidden_size", "dropout_rate", "num_layers"),
+    "cnn": ("kernel_size",),
+}
+
+
+def compute_params_hash(model_type: str, params: dict) -> str:
+    """
+    Canonical hash over the parameters that make two jobs duplicates.
+
+    Stored indexed on the Job row, so duplicate detection is one B-tree
+    lookup instead of comparing parameter values.
+    """
+    keys = CORE_PARAM_KEYS + MODEL_PARAM_KEYS.get(model_type, ())
+    canonical = {key: params.get(key) for key in keys}
+    digest = hashlib.blake2b(
+        json.dumps(canonical, sort_keys=True).encode(), digest_size=16)
+    return digest.hexdigest()
+
+
+def job_id_bytes(job_id: str) -> bytes:
+    """
+    Convert an external hex job id to the raw 16 bytes stored in the DB.
+
+    Raises a 404 for malformed ids, since no job can match them.
+    """
+    try:
+        return uuid.UUID(hex=job_id).bytes
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+# Create FastAPI app. orjson handles the JSON-heavy responses (notably the
+# history arrays in JobWithHistory) several times faster than json.dumps.
+app = FastAPI(title="Experiment Hub API", default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -28,109 +71,344 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# WebSocket connections dictionary
+# Outbound message queue per connected client. Broadcasting enqueues
+# without awaiting; a dedicated sender task per client drains its queue.
 ws_connections = {}
 
+# Bounded so a consumer that stops reading costs dropped frames, not memory
+WS_QUEUE_SIZE = 32
+
+# Per-client experiment subscriptions. A client with no entry (or an empty
+# set) receives every update, so clients that never subscribe keep working.
+ws_subscriptions = {}
+
+# job_id -> experiment_id, so broadcasts resolve their topic without a query
+job_experiment_ids = {}
+
+# Cache-aside store for the hot read endpoints. Experiment metadata and
+# finished jobs rarely change between writes, so reads are served from here
+# and the write paths invalidate the affected keys.
+read_cache = TTLCache(maxsize=1024, ttl=300.0)
+
+# job_id -> primary key, so repeated writes for an active job address the
+# row directly instead of re-resolving the job_id index every time
+job_pk_cache = TTLCache(maxsize=4096, ttl=300.0)
+
+# Version counters for cached job list views, keyed by experiment id (or
+# JOBS_ALL for the unfiltered list). Bumping a version orphans every cached
+# page in that scope while lists for other experiments stay warm; orphaned
+# entries age out via the cache TTL.
+job_list_versions = {}
+JOBS_ALL = "all"
+
+
+def bump_job_list_version(experiment_id=None):
+    scopes = (experiment_id, JOBS_ALL) if experiment_id is not None else (JOBS_ALL,)
+    for scope in scopes:
+        job_list_versions[scope] = job_list_versions.get(scope, 0) + 1
+
+# The application's event loop, captured at startup so training worker
+# threads can schedule coroutines onto it
+app_loop = None
+
+# Bounded worker pool for the blocking training loops. asyncio.to_thread
+# would spawn one thread per submitted job, so a burst of submissions
+# oversubscribes the CPU and thrashes GPU memory; with a fixed pool, excess
+# jobs queue inside the executor and start as workers free up.
+TRAIN_POOL = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("TRAIN_WORKERS", "1")),
+    thread_name_prefix="train",
+)
+
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
-    init_db()
+    global app_loop
+    app_loop = asyncio.get_running_loop()
+    await init_db()
+
+# Long-lived sender task: drains one client's queue so a slow client only
+# backs up (and eventually drops) its own messages
+async def ws_sender(websocket: WebSocket, queue: asyncio.Queue):
+    while True:
+        payload = await queue.get()
+        # Payloads are pre-encoded text (see send_ws_update)
+        try:
+            await websocket.send_text(payload)
+        except Exception:
+            return
 
 # WebSocket endpoint for real-time updates
 @app.websocket("/ws/{client_id}")
 async def websocket_endpoint(websocket: WebSocket, client_id: str):
     await websocket.accept()
-    ws_connections[client_id] = websocket
+    queue = asyncio.Queue(maxsize=WS_QUEUE_SIZE)
+    ws_connections[client_id] = queue
+    sender = asyncio.create_task(ws_sender(websocket, queue))
     try:
         while True:
-            # Keep connection alive
-            await websocket.receive_text()
+            # Clients may scope themselves to specific experiments with
+            # {"subscribe": [experiment_id, ...]}; other messages are
+            # treated as keep-alives
+            message = await websocket.receive_text()
+            try:
+                parsed = json.loads(message)
+            except ValueError:
+                continue
+            if isinstance(parsed, dict) and isinstance(parsed.get("subscribe"), list):
+                # Coerce ids to int so they compare equal to the integer
+                # experiment ids used for routing; ignore malformed entries
+                # rather than letting them tear down the connection
+                try:
+                    ws_subscriptions[client_id] = {
+                        int(entry) for entry in parsed["subscribe"]}
+                except (TypeError, ValueError):
+                    continue
     except WebSocketDisconnect:
-        if client_id in ws_connections:
-            del ws_connections[client_id]
+        pass
+    finally:
+        sender.cancel()
+        ws_connections.pop(client_id, None)
+        ws_subscriptions.pop(client_id, None)
+
+# Resolve which experiment a job belongs to, memoized for broadcasts
+async def resolve_experiment_id(job_id: str):
+    experiment_id = job_experiment_ids.get(job_id)
+    if experiment_id is None:
+        async with SessionLocal() as db:
+            result = await db.execute(
+                select(Job.experiment_id).filter(Job.job_id == job_id_bytes(job_id)))
+            experiment_id = result.scalar()
+        if experiment_id is not None:
+            job_experiment_ids[job_id] = experiment_id
+    return experiment_id
 
 # Helper function to send WebSocket updates
 async def send_ws_update(job_id: str, data: dict):
-    # Send update to all connected clients
-    disconnected_clients = []
-    for client_id, websocket in ws_connections.items():
+    if not ws_connections:
+        return
+
+    # Route the update only to clients subscribed to this job's experiment
+    # (clients without a subscription receive everything). Enqueueing never
+    # awaits, so broadcast cost is O(clients) dict/queue operations and a
+    # slow client can't stall the training callback; when a client's queue
+    # is full the update is simply dropped for that client.
+    # Encode once for the whole broadcast; send_json would re-serialize the
+    # same dict for every client
+    experiment_id = await resolve_experiment_id(job_id)
+    payload = orjson.dumps(
+        {"job_id": job_id, "data": data}, default=str).decode()
+    for client_id, queue in list(ws_connections.items()):
+        if (ws_subscriptions.get(client_id)
+                and experiment_id not in ws_subscriptions[client_id]):
+            continue
         try:
-            await websocket.send_json({"job_id": job_id, "data": data})
-        except:
-            disconnected_clients.append(client_id)
-    
-    # Clean up disconnected clients
-    for client_id in disconnected_clients:
-        if client_id in ws_connections:
-            del ws_connections[client_id]
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            pass
+
+# Pending status writes per job_id, merged between flushes so a burst of
+# batch-level callbacks becomes one UPDATE per flush interval instead of a
+# SELECT-then-commit (and SQLite fsync) for every callback.
+pending_status_values = {}
+status_flush_tasks = {}
+
+# One session per active job, reused across status flushes so each flush
+# skips connection acquisition; closed by the terminal flush
+job_status_sessions = {}
+
+# AsyncSession forbids concurrent operations, and a debounced flush task
+# can wake while an epoch callback is mid-await on the same session, so
+# every use of a job's session is serialized through its lock
+job_status_locks = {}
+
+
+def job_status_lock(job_id: str) -> asyncio.Lock:
+    lock = job_status_locks.get(job_id)
+    if lock is None:
+        lock = job_status_locks[job_id] = asyncio.Lock()
+    return lock
+
+STATUS_FLUSH_INTERVAL = 0.25
+
+
+def job_status_values(status_data: dict) -> dict:
+    # Translate a callback payload into Job column values
+    values = {}
+    if "epoch" in status_data:
+        values["epochs_completed"] = status_data["epoch"]
+
+    if status_data.get("status") == "completed" and "final_results" in status_data:
+        results = status_data["final_results"]
+        values["status"] = "completed"
+        values["completed_at"] = datetime.utcnow()
+        values["best_accuracy"] = results.get("best_accuracy")
+        values["total_time"] = results.get("total_time")
+    elif status_data.get("status") == "failed":
+        values["status"] = "failed"
+        values["completed_at"] = datetime.utcnow()
+
+    return values
+
+
+async def flush_job_status(job_id: str, final: bool = False):
+    # Write the merged pending values for a job in a single UPDATE
+    async with job_status_lock(job_id):
+        values = pending_status_values.pop(job_id, None)
+        if values:
+            # Address the row by primary key when we have it cached; fall
+            # back to the job_id index otherwise
+            pk = job_pk_cache.get(job_id)
+            where = Job.id == pk if pk is not None else Job.job_id == job_id_bytes(job_id)
+
+            db = job_status_sessions.get(job_id)
+            if db is None:
+                db = SessionLocal()
+                job_status_sessions[job_id] = db
+            await db.execute(update(Job).where(where).values(**values))
+            await db.commit()
+            read_cache.delete(f"job:{job_id}")
+            bump_job_list_version(await resolve_experiment_id(job_id))
+
+        if final:
+            db = job_status_sessions.pop(job_id, None)
+            if db is not None:
+                await db.close()
+
+    # Drop the lock once the job has neither a session nor pending values
+    # (the terminal flush, or a stale debounced wake after it), so per-job
+    # entries don't accumulate
+    if job_id not in job_status_sessions and job_id not in pending_status_values:
+        job_status_locks.pop(job_id, None)
+
+
+async def record_epoch_metric(job_id: str, status_data: dict):
+    # Append one metric row per completed epoch, reusing the job's status
+    # session. Rewriting the whole history JSON here instead would write
+    # O(epochs) bytes per epoch.
+    async with job_status_lock(job_id):
+        db = job_status_sessions.get(job_id)
+        if db is None:
+            db = SessionLocal()
+            job_status_sessions[job_id] = db
+
+        pk = job_pk_cache.get(job_id)
+        if pk is None:
+            result = await db.execute(
+                select(Job.id).filter(Job.job_id == job_id_bytes(job_id)))
+            pk = result.scalar()
+            if pk is None:
+                return
+            job_pk_cache.set(job_id, pk)
+
+        await db.execute(
+            insert(JobEpochMetric).values(
+                job_id=pk,
+                epoch=status_data["epoch"],
+                train_loss=status_data.get("train_loss"),
+                train_accuracy=status_data.get("train_accuracy"),
+                val_loss=status_data.get("val_loss"),
+                val_accuracy=status_data.get("val_accuracy"),
+                epoch_time=status_data.get("epoch_time"),
+            )
+        )
+        await db.commit()
+
+
+def build_history(metrics) -> dict | None:
+    # Assemble the column-oriented history shape the UI charts from the
+    # per-epoch metric rows (ordered by epoch)
+    if not metrics:
+        return None
+    return {
+        "train_loss": [m.train_loss for m in metrics],
+        "train_accuracy": [m.train_accuracy for m in metrics],
+        "val_loss": [m.val_loss for m in metrics],
+        "val_accuracy": [m.val_accuracy for m in metrics],
+        "epoch_times": [m.epoch_time for m in metrics],
+    }
+
+
+async def flush_job_status_later(job_id: str):
+    await asyncio.sleep(STATUS_FLUSH_INTERVAL)
+    status_flush_tasks.pop(job_id, None)
+    await flush_job_status(job_id)
+
 
 # Status update callback for training job
 async def training_status_callback(status_data):
     job_id = status_data.get("job_id")
-    
-    # Update database with status
-    async def update_job_in_db():
-        db = next(get_db())
-        job = db.query(Job).filter(Job.job_id == job_id).first()
-        
-        if not job:
-            return
-        
-        if "epoch" in status_data:
-            job.epochs_completed = status_data["epoch"]
-        
-        if status_data.get("status") == "completed" and "final_results" in status_data:
-            results = status_data["final_results"]
-            job.status = "completed"
-            job.completed_at = datetime.utcnow()
-            job.best_accuracy = results.get("best_accuracy")
-            job.total_time = results.get("total_time")
-            job.history = results.get("history")
-        elif status_data.get("status") == "failed":
-            job.status = "failed"
-            job.completed_at = datetime.utcnow()
-        
-        db.commit()
-    
-    # Run database update
-    loop = asyncio.get_event_loop()
-    asyncio.create_task(update_job_in_db())
-    
+
+    # Coalesce database writes: merge into the pending values and flush at
+    # most once per interval, except terminal states which flush immediately
+    # End-of-epoch summaries (identified by epoch_time; batch-level events
+    # don't carry it) append a metric row before any terminal flush closes
+    # the job's session
+    if "epoch_time" in status_data and status_data.get("status") == "running":
+        await record_epoch_metric(job_id, status_data)
+
+    values = job_status_values(status_data)
+    if values:
+        pending_status_values.setdefault(job_id, {}).update(values)
+
+        if status_data.get("status") in ("completed", "failed"):
+            # Leave any in-flight debounced flusher alone — cancelling it
+            # could interrupt a statement mid-execute on the shared session.
+            # It drains the pending values first if it holds the lock, and
+            # otherwise wakes to find nothing to write.
+            status_flush_tasks.pop(job_id, None)
+            await flush_job_status(job_id, final=True)
+        elif job_id not in status_flush_tasks:
+            status_flush_tasks[job_id] = asyncio.create_task(
+                flush_job_status_later(job_id))
+
     # Send WebSocket update
     await send_ws_update(job_id, status_data)
 
+    # Finished jobs no longer broadcast, so drop their topic entry
+    if status_data.get("status") in ("completed", "failed"):
+        job_experiment_ids.pop(job_id, None)
+
 # Background task to run training job
-def run_training_job(job_id: str, model_type: str, parameters: dict):
-    # Create event loop for async operations
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
+async def run_training_job(job_id: str, model_type: str, parameters: dict):
     # Update job status to running
-    db = next(get_db())
-    job = db.query(Job).filter(Job.job_id == job_id).first()
-    if job:
-        job.status = "running"
-        job.started_at = datetime.utcnow()
-        db.commit()
-    
+    async with SessionLocal() as db:
+        result = await db.execute(
+            select(Job).filter(Job.job_id == job_id_bytes(job_id)))
+        job = result.scalars().first()
+        if job:
+            job.status = "running"
+            job.started_at = datetime.utcnow()
+            await db.commit()
+            read_cache.delete(f"job:{job_id}")
+            job_pk_cache.set(job_id, job.id)
+            bump_job_list_version(job.experiment_id)
+
+    # Status callbacks fire from the training thread; dispatch them back
+    # onto the shared application loop instead of spinning up a fresh
+    # loop per callback
+    def status_callback(status_data):
+        asyncio.run_coroutine_threadsafe(
+            training_status_callback(status_data), app_loop)
+
     # Create model and train
     try:
         # Create model
-        model_params = {k: v for k, v in parameters.items() 
+        model_params = {k: v for k, v in parameters.items()
                        if k in ['dropout_rate', 'hidden_size', 'kernel_size', 'num_layers']}
         model = create_model(model_type, **model_params)
-        
+
         # Training params
-        training_params = {k: v for k, v in parameters.items() 
+        training_params = {k: v for k, v in parameters.items()
                           if k not in ['dropout_rate', 'hidden_size', 'kernel_size', 'num_layers']}
-        
-        # Setup callback for status updates
-        def status_callback(status_data):
-            loop.run_until_complete(training_status_callback(status_data))
-        
-        # Train the model
-        train_model(model, job_id, training_params, status_callback)
-    
+
+        # Run the blocking training loop on the bounded pool so the event
+        # loop stays free for requests and status callbacks while overall
+        # training concurrency stays capped at TRAIN_WORKERS
+        await asyncio.get_running_loop().run_in_executor(
+            TRAIN_POOL,
+            partial(train_model, model, job_id, training_params, status_callback))
+
     except Exception as e:
         # Handle exceptions
         error_info = {
@@ -138,193 +416,248 @@ def run_training_job(job_id: str, model_type: str, parameters: dict):
             "status": "failed",
             "error": str(e)
         }
-        loop.run_until_complete(training_status_callback(error_info))
-    
-    finally:
-        loop.close()
+        await training_status_callback(error_info)
 
 # API Endpoints
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Welcome to Experiment Hub API"}
 
 # Experiments endpoints
 @app.post("/experiments/", response_model=ExperimentResponse)
-def create_experiment(experiment: ExperimentCreate, db: Session = Depends(get_db)):
+async def create_experiment(experiment: ExperimentCreate, db: AsyncSession = Depends(get_db)):
     db_experiment = Experiment(**experiment.dict())
     db.add(db_experiment)
-    db.commit()
-    db.refresh(db_experiment)
+    await db.commit()
+    read_cache.delete_prefix("experiments:list:")
     return db_experiment
 
 @app.get("/experiments/", response_model=list[ExperimentResponse])
-def read_experiments(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    experiments = db.query(Experiment).offset(skip).limit(limit).all()
+async def read_experiments(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
+    cache_key = f"experiments:list:{skip}:{limit}"
+    experiments = read_cache.get(cache_key)
+    if experiments is None:
+        result = await db.execute(select(Experiment).offset(skip).limit(limit))
+        experiments = result.scalars().all()
+        read_cache.set(cache_key, experiments)
     return experiments
 
 @app.get("/experiments/{experiment_id}", response_model=ExperimentResponse)
-def read_experiment(experiment_id: int, db: Session = Depends(get_db)):
-    experiment = db.query(Experiment).filter(Experiment.id == experiment_id).first()
-    if not experiment:
-        raise HTTPException(status_code=404, detail="Experiment not found")
+async def read_experiment(experiment_id: int, db: AsyncSession = Depends(get_db)):
+    cache_key = f"experiment:{experiment_id}"
+    experiment = read_cache.get(cache_key)
+    if experiment is None:
+        result = await db.execute(select(Experiment).filter(Experiment.id == experiment_id))
+        experiment = result.scalars().first()
+        if not experiment:
+            raise HTTPException(status_code=404, detail="Experiment not found")
+        read_cache.set(cache_key, experiment)
     return experiment
 
 @app.delete("/experiments/{experiment_id}")
-def delete_experiment(experiment_id: int, db: Session = Depends(get_db)):
-    experiment = db.query(Experiment).filter(Experiment.id == experiment_id).first()
+async def delete_experiment(experiment_id: int, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(select(Experiment).filter(Experiment.id == experiment_id))
+    experiment = result.scalars().first()
     if not experiment:
         raise HTTPException(status_code=404, detail="Experiment not found")
-    
-    db.delete(experiment)
-    db.commit()
+
+    # Collect the job ids before the delete detaches the job rows
+    job_hex_ids = [uuid.UUID(bytes=j.job_id).hex for j in experiment.jobs]
+
+    await db.delete(experiment)
+    await db.commit()
+
+    # Invalidate the experiment, its cached jobs, and any list views only
+    # after the commit; doing it earlier lets a concurrent read re-cache
+    # the still-visible rows for a full TTL
+    read_cache.delete(
+        f"experiment:{experiment_id}",
+        *(f"job:{hex_id}" for hex_id in job_hex_ids))
+    read_cache.delete_prefix("experiments:list:")
+    bump_job_list_version(experiment_id)
+
+    # Cascade-deleted jobs must also leave the per-job maps, or a still-
+    # running training callback keeps writing against a stale cached pk
+    for hex_id in job_hex_ids:
+        job_experiment_ids.pop(hex_id, None)
+        job_pk_cache.delete(hex_id)
     return {"message": "Experiment deleted successfully"}
 
 # Jobs endpoints
 @app.post("/jobs/", response_model=JobResponse)
-def create_job(job: JobCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+async def create_job(job: JobCreate, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)):
     # Check if experiment exists
-    experiment = db.query(Experiment).filter(Experiment.id == job.experiment_id).first()
+    result = await db.execute(select(Experiment).filter(Experiment.id == job.experiment_id))
+    experiment = result.scalars().first()
     if not experiment:
         raise HTTPException(status_code=404, detail="Experiment not found")
-    
-    # Check for duplicate job
-    existing_job = db.query(Job).filter(
-        Job.experiment_id == job.experiment_id,
-        Job.model_type == job.model_type
-    ).all()
-    
-    # Debug logging
-    print(f"Creating job: {job.name}, Model: {job.model_type}, Params: {job.parameters}")
-    print(f"Found {len(existing_job)} existing jobs with same experiment and model type")
-    
-    # Check for exact parameter matches by comparing individual parameters
-    # Some parameters like dropout_rate, hidden_size, etc. are allowed to be different
-    duplicate_found = False
-    for ej in existing_job:
-        ej_params = ej.parameters
-        job_params = job.parameters.dict()
-        
-        print(f"Comparing with job: {ej.name}, ID: {ej.job_id}")
-        print(f"Existing params: {ej_params}")
-        print(f"New params: {job_params}")
-        
-        # Compare essential parameters
-        core_match = (
-            ej_params.get('optimizer') == job_params.get('optimizer') and
-            ej_params.get('learning_rate') == job_params.get('learning_rate') and
-            ej_params.get('batch_size') == job_params.get('batch_size') and
-            ej_params.get('epochs') == job_params.get('epochs')
-        )
-        
-        print(f"Core parameters match: {core_match}")
-        
-        # Check model-specific parameters
-        specific_params_match = False  # Start with False
-        if job.model_type == 'mlp':
-            # For MLP, compare hidden_size and dropout_rate
-            ej_hidden = ej_params.get('hidden_size')
-            new_hidden = job_params.get('hidden_size')
-            ej_dropout = ej_params.get('dropout_rate') 
-            new_dropout = job_params.get('dropout_rate')
-            ej_num_layers = ej_params.get('num_layers')
-            new_num_layers = job_params.get('num_layers')
-            
-            specific_params_match = (
-                ej_hidden == new_hidden and 
-                ej_dropout == new_dropout and
-                ej_num_layers == new_num_layers
+
+    logger.debug("Creating job: %s, Model: %s, Params: %s",
+                 job.name, job.model_type, job.parameters)
+
+    # Check for duplicate job with a single indexed lookup on the canonical
+    # parameter hash instead of comparing parameter values in the query
+    job_params = job.parameters.dict()
+    params_hash = compute_params_hash(job.model_type, job_params)
+    if job.model_type in MODEL_PARAM_KEYS:
+        result = await db.execute(
+            select(Job)
+            .filter(
+                Job.experiment_id == job.experiment_id,
+                Job.model_type == job.model_type,
+                Job.params_hash == params_hash,
             )
-            print(f"MLP specific - hidden: {ej_hidden} vs {new_hidden}, dropout: {ej_dropout} vs {new_dropout}, layers: {ej_num_layers} vs {new_num_layers}")
-        elif job.model_type == 'cnn':
-            # For CNN, compare kernel_size
-            ej_kernel = ej_params.get('kernel_size')
-            new_kernel = job_params.get('kernel_size')
-            specific_params_match = (ej_kernel == new_kernel)
-            print(f"CNN specific - kernel: {ej_kernel} vs {new_kernel}")
-        
-        print(f"Specific parameters match: {specific_params_match}")
-        
-        # If both core and specific parameters match, it's a duplicate
-        if core_match and specific_params_match:
-            print(f"DUPLICATE FOUND - returning existing job {ej.job_id}")
-            duplicate_found = True
-            return ej
-    
-    print("No duplicate found - creating new job")
-    # If no duplicate found, create new job
-    job_id = str(uuid.uuid4())
-    db_job = Job(
-        job_id=job_id,
-        name=job.name,
-        experiment_id=job.experiment_id,
-        model_type=job.model_type,
-        parameters=job.parameters.dict(),
-        status="pending"
+            .limit(1)
+        )
+        duplicate = result.scalars().first()
+        if duplicate:
+            logger.debug("Duplicate found - returning existing job %s", duplicate.job_id)
+            return duplicate
+
+    logger.debug("No duplicate found - creating new job")
+    # If no duplicate found, create new job. The Core insert with RETURNING
+    # writes and reads back the row in one round-trip, skipping the ORM
+    # unit-of-work bookkeeping and the post-commit refresh SELECT.
+    job_uuid = uuid.uuid4()
+    job_id = job_uuid.hex
+    result = await db.execute(
+        insert(Job)
+        .values(
+            job_id=job_uuid.bytes,
+            name=job.name,
+            experiment_id=job.experiment_id,
+            model_type=job.model_type,
+            parameters=job_params,
+            params_hash=params_hash,
+            status="pending",
+        )
+        .returning(Job)
     )
-    
-    db.add(db_job)
-    db.commit()
-    db.refresh(db_job)
-    
+    db_job = result.scalars().first()
+    await db.commit()
+
+    # The cached experiment carries its job list, so drop it
+    read_cache.delete(f"experiment:{job.experiment_id}")
+    job_experiment_ids[job_id] = job.experiment_id
+    job_pk_cache.set(job_id, db_job.id)
+    bump_job_list_version(job.experiment_id)
+
     # Start training job in background
     background_tasks.add_task(
         run_training_job,
         job_id=job_id,
         model_type=job.model_type,
-        parameters=job.parameters.dict()
+        parameters=job_params
     )
-    
+
     return db_job
 
 @app.get("/jobs/", response_model=list[JobResponse])
-def read_jobs(
+async def read_jobs(
     experiment_id: int = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(Job)
+    scope = experiment_id if experiment_id else JOBS_ALL
+    version = job_list_versions.get(scope, 0)
+    cache_key = f"jobs:list:{scope}:{skip}:{limit}:v{version}"
+    jobs = read_cache.get(cache_key)
+    if jobs is not None:
+        return jobs
+
+    # Project only the summary columns: the list view never serializes
+    # history, so skip transferring and hydrating that blob per row
+    query = select(Job).options(load_only(
+        Job.job_id, Job.experiment_id, Job.name, Job.status, Job.model_type,
+        Job.parameters, Job.best_accuracy, Job.total_time,
+        Job.epochs_completed, Job.created_at, Job.started_at, Job.completed_at,
+    ))
     if experiment_id:
         query = query.filter(Job.experiment_id == experiment_id)
-    
-    jobs = query.offset(skip).limit(limit).all()
+
+    result = await db.execute(query.offset(skip).limit(limit))
+    jobs = result.scalars().all()
+    read_cache.set(cache_key, jobs, ttl=30.0)
     return jobs
 
 @app.get("/jobs/{job_id}", response_model=JobWithHistory)
-def read_job(job_id: str, db: Session = Depends(get_db)):
-    job = db.query(Job).filter(Job.job_id == job_id).first()
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
+async def read_job(job_id: str, db: AsyncSession = Depends(get_db)):
+    cache_key = f"job:{job_id}"
+    job = read_cache.get(cache_key)
+    if job is None:
+        result = await db.execute(
+            select(Job).filter(Job.job_id == job_id_bytes(job_id)))
+        job = result.scalars().first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        result = await db.execute(
+            select(JobEpochMetric)
+            .filter(JobEpochMetric.job_id == job.id)
+            .order_by(JobEpochMetric.epoch))
+        # Attach the assembled history for the response schema; it is not a
+        # mapped column, so this never touches the database
+        job.history = build_history(result.scalars().all())
+        read_cache.set(cache_key, job)
     return job
 
+@app.get("/jobs/{job_id}/history")
+async def read_job_history(job_id: str, db: AsyncSession = Depends(get_db)):
+    # History lives in the append-only metric rows; fetch them with one
+    # indexed join and encode the assembled document with orjson
+    result = await db.execute(
+        select(Job.id).filter(Job.job_id == job_id_bytes(job_id)))
+    pk = result.scalar()
+    if pk is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    result = await db.execute(
+        select(JobEpochMetric)
+        .filter(JobEpochMetric.job_id == pk)
+        .order_by(JobEpochMetric.epoch))
+    history = build_history(result.scalars().all())
+    return Response(content=orjson.dumps(history), media_type="application/json")
+
 @app.delete("/jobs/{job_id}", response_model=dict)
-def delete_job(job_id: str, db: Session = Depends(get_db)):
-    job = db.query(Job).filter(Job.job_id == job_id).first()
+async def delete_job(job_id: str, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(
+        select(Job).filter(Job.job_id == job_id_bytes(job_id)))
+    job = result.scalars().first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    
-    # Delete the job
-    db.delete(job)
-    db.commit()
-    
+
+    # Delete the job, then invalidate; invalidating before the commit lets
+    # a concurrent read re-cache the still-visible row for a full TTL
+    experiment_id = job.experiment_id
+    await db.delete(job)
+    await db.commit()
+
+    read_cache.delete(f"job:{job_id}", f"experiment:{experiment_id}")
+    job_experiment_ids.pop(job_id, None)
+    job_pk_cache.delete(job_id)
+    bump_job_list_version(experiment_id)
+
     return {"message": "Job deleted successfully", "job_id": job_id}
 
 @app.post("/jobs/{job_id}/cancel", response_model=dict)
-def cancel_job(job_id: str, db: Session = Depends(get_db)):
-    job = db.query(Job).filter(Job.job_id == job_id).first()
+async def cancel_job(job_id: str, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(
+        select(Job).filter(Job.job_id == job_id_bytes(job_id)))
+    job = result.scalars().first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    
+
     if job.status not in ["pending", "running"]:
         raise HTTPException(status_code=400, detail="Job cannot be cancelled")
-    
+
     # Cancel the job
     job.status = "failed"
     job.completed_at = datetime.utcnow()
-    db.commit()
-    
+    await db.commit()
+    read_cache.delete(f"job:{job_id}")
+    bump_job_list_version(job.experiment_id)
+
     return {"message": "Job cancelled successfully", "job_id": job_id}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,6 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
+import orjson
+import uuid
 
 # Experiment schemas
 class ExperimentBase(BaseModel):
@@ -51,13 +53,29 @@ class JobResponse(JobBase):
     created_at: datetime
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    
+
+    @field_validator("job_id", mode="before")
+    @classmethod
+    def encode_job_id(cls, value):
+        # job_id is stored as a raw 16-byte UUID; expose it as hex
+        if isinstance(value, (bytes, bytearray)):
+            return uuid.UUID(bytes=bytes(value)).hex
+        return value
+
     class Config:
         from_attributes = True
 
 class JobWithHistory(JobResponse):
     history: Optional[Dict[str, List[float]]] = None
-    
+
+    @field_validator("history", mode="before")
+    @classmethod
+    def decode_history(cls, value):
+        # history is persisted as pre-encoded JSON text
+        if isinstance(value, (str, bytes)):
+            return orjson.loads(value)
+        return value
+
     class Config:
         from_attributes = True
 
@@ -0,0 +1,3 @@
+"""
+Machine learning model implementations and training utilities.
+"""
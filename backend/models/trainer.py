@@ -1,8 +1,7 @@
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from torch.utils.data import DataLoader
-from torchvision import datasets, transforms
+from torchvision import datasets
 import time
 import json
 import os
@@ -12,66 +11,113 @@ import traceback
 # Set the default device
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
-def get_data_loaders(batch_size=64):
-    """Get MNIST training and test data loaders."""
-    transform = transforms.Compose([
-        transforms.ToTensor(),
-        transforms.Normalize((0.1307,), (0.3081,))
-    ])
-    
-    # Download and load the MNIST training data
-    train_dataset = datasets.MNIST('data', train=True, download=True, transform=transform)
-    train_loader = DataLoader(train_dataset, batch_size=batch_size, shuffle=True)
-    
-    # Download and load the MNIST test data
-    test_dataset = datasets.MNIST('data', train=False, transform=transform)
-    test_loader = DataLoader(test_dataset, batch_size=batch_size, shuffle=False)
-    
-    return train_loader, test_loader
+# Input shapes are fixed (28x28 MNIST), so let cuDNN autotune and cache the
+# fastest conv algorithms once per shape
+torch.backends.cudnn.benchmark = True
+
+# Allow TF32 matmuls on Ampere+ so the fully connected layers use Tensor
+# Cores even outside the autocast regions
+torch.set_float32_matmul_precision('high')
+
+# Minimum seconds between intra-epoch status emissions; each emission hops
+# threads, updates the DB and fans out over WebSockets, so they are rate-
+# limited here at the source
+STATUS_EMIT_INTERVAL = 0.25
+
+def get_device_tensors():
+    """
+    Load MNIST once as normalized tensors resident on the training device.
+
+    The full dataset (70k 28x28 floats, ~210 MB) fits comfortably in VRAM,
+    so it is uploaded a single time and batches are cut by index slicing.
+    This replaces the per-sample PIL/transform/DataLoader pipeline, turning
+    a CPU-bound input path into a pure tensor loop.
+    """
+    train_dataset = datasets.MNIST('data', train=True, download=True)
+    test_dataset = datasets.MNIST('data', train=False)
+
+    def pack(dataset):
+        # Same normalization as transforms.Normalize((0.1307,), (0.3081,))
+        data = dataset.data.to(device).float().div_(255).sub_(0.1307).div_(0.3081)
+        return data.unsqueeze(1).contiguous(), dataset.targets.to(device)
+
+    train_data, train_targets = pack(train_dataset)
+    test_data, test_targets = pack(test_dataset)
+    return train_data, train_targets, test_data, test_targets
+
+def iterate_batches(data, targets, batch_size, shuffle=False):
+    """Yield (data, target) batches by slicing the preloaded tensors."""
+    n = data.size(0)
+    if shuffle:
+        perm = torch.randperm(n, device=data.device)
+        for i in range(0, n, batch_size):
+            idx = perm[i:i + batch_size]
+            yield data[idx], targets[idx]
+    else:
+        for i in range(0, n, batch_size):
+            yield data[i:i + batch_size], targets[i:i + batch_size]
 
-def train_epoch(model, train_loader, optimizer, epoch, job_id, status_callback):
-    """Train the model for one epoch."""
+def train_epoch(model, train_data, train_targets, batch_size, optimizer, scaler,
+                epoch, job_id, status_callback):
+    """Train the model for one epoch using mixed precision when on GPU."""
     model.train()
-    train_loss = 0
-    correct = 0
+    # Accumulate metrics as device tensors; calling .item() per batch would
+    # force a full device sync each step, serializing the GPU with the
+    # Python loop. The tensors are read back only at emission points.
+    train_loss_t = torch.zeros((), device=device)
+    correct_t = torch.zeros((), device=device, dtype=torch.long)
     total = 0
     start_time = time.time()
-    
-    for batch_idx, (data, target) in enumerate(train_loader):
-        data, target = data.to(device), target.to(device)
-        optimizer.zero_grad()
-        output = model(data)
-        loss = nn.functional.nll_loss(output, target)
-        loss.backward()
-        optimizer.step()
+    amp_enabled = scaler.is_enabled()
+    num_samples = train_data.size(0)
+    num_batches = (num_samples + batch_size - 1) // batch_size
+    last_emit = time.monotonic()
+
+    batches = iterate_batches(train_data, train_targets, batch_size, shuffle=True)
+    for batch_idx, (data, target) in enumerate(batches):
+        # set_to_none skips the gradient-zeroing kernels entirely
+        optimizer.zero_grad(set_to_none=True)
+        # Run forward/loss in FP16 on Tensor Cores; the scaler keeps small
+        # gradients from underflowing and is a no-op on CPU
+        with torch.autocast(device_type=device.type, dtype=torch.float16,
+                            enabled=amp_enabled):
+            output = model(data)
+            # Models return raw logits; cross_entropy fuses log_softmax and
+            # nll_loss into one kernel and skips the log-probability tensor
+            loss = nn.functional.cross_entropy(output, target)
+        scaler.scale(loss).backward()
+        scaler.step(optimizer)
+        scaler.update()
         
-        train_loss += loss.item()
+        train_loss_t += loss.detach()
         pred = output.argmax(dim=1, keepdim=True)
-        correct += pred.eq(target.view_as(pred)).sum().item()
+        correct_t += pred.eq(target.view_as(pred)).sum()
         total += target.size(0)
         
-        if batch_idx % 100 == 0:
-            current_batch = batch_idx * len(data)
-            total_batches = len(train_loader.dataset)
-            progress = 100. * batch_idx / len(train_loader)
-            avg_loss = train_loss / (batch_idx + 1)
-            accuracy = 100. * correct / total
-            
+        # Emit progress at most once per interval; later batches overwrite
+        # earlier ones anyway, so intermediate updates carry no extra signal
+        now = time.monotonic()
+        if status_callback and now - last_emit >= STATUS_EMIT_INTERVAL:
+            last_emit = now
+            current_batch = batch_idx * batch_size
+            progress = 100. * batch_idx / num_batches
+            avg_loss = train_loss_t.item() / (batch_idx + 1)
+            accuracy = 100. * correct_t.item() / total
+
             status = {
                 "job_id": job_id,
                 "epoch": epoch,
                 "train_loss": avg_loss,
                 "train_accuracy": accuracy,
                 "progress": progress,
-                "batch": f"{current_batch}/{total_batches}",
+                "batch": f"{current_batch}/{num_samples}",
                 "time": time.time() - start_time
             }
-            
-            if status_callback:
-                status_callback(status)
+
+            status_callback(status)
     
-    epoch_loss = train_loss / len(train_loader)
-    epoch_accuracy = 100. * correct / total
+    epoch_loss = train_loss_t.item() / num_batches
+    epoch_accuracy = 100. * correct_t.item() / total
     epoch_time = time.time() - start_time
     
     return {
@@ -80,23 +126,26 @@ def train_epoch(model, train_loader, optimizer, epoch, job_id, status_callback):
         "time": epoch_time
     }
 
-def validate(model, test_loader):
+def validate(model, test_data, test_targets, batch_size):
     """Validate the model on the test set."""
     model.eval()
     test_loss = 0
     correct = 0
     start_time = time.time()
-    
-    with torch.no_grad():
-        for data, target in test_loader:
-            data, target = data.to(device), target.to(device)
-            output = model(data)
-            test_loss += nn.functional.nll_loss(output, target, reduction='sum').item()
+    num_samples = test_data.size(0)
+
+    with torch.inference_mode():
+        for data, target in iterate_batches(test_data, test_targets, batch_size):
+            # bfloat16 has enough range that validation needs no loss scaling
+            with torch.autocast(device_type=device.type, dtype=torch.bfloat16,
+                                enabled=device.type == "cuda"):
+                output = model(data)
+            test_loss += nn.functional.cross_entropy(output, target, reduction='sum').item()
             pred = output.argmax(dim=1, keepdim=True)
             correct += pred.eq(target.view_as(pred)).sum().item()
-    
-    test_loss /= len(test_loader.dataset)
-    accuracy = 100. * correct / len(test_loader.dataset)
+
+    test_loss /= num_samples
+    accuracy = 100. * correct / num_samples
     validation_time = time.time() - start_time
     
     return {
@@ -128,16 +177,33 @@ def train_model(model, job_id, config, status_callback=None):
         # Move model to the device
         model = model.to(device)
         
-        # Create data loaders
-        train_loader, test_loader = get_data_loaders(batch_size)
-        
-        # Setup optimizer
+        # Preload the dataset onto the device once for the whole run
+        train_data, train_targets, test_data, test_targets = get_device_tensors()
+
+        # Convolutional models run in channels_last so cuDNN dispatches its
+        # native NHWC Tensor Core kernels instead of transposing around the
+        # default NCHW layout. Batches are slices of the preloaded tensors,
+        # so converting those once covers every step.
+        if device.type == "cuda" and any(
+                isinstance(m, nn.Conv2d) for m in model.modules()):
+            model = model.to(memory_format=torch.channels_last)
+            train_data = train_data.contiguous(memory_format=torch.channels_last)
+            test_data = test_data.contiguous(memory_format=torch.channels_last)
+
+        # Setup optimizer. fused/foreach run the parameter update as one
+        # multi-tensor kernel instead of launching one kernel per parameter,
+        # which matters most for the many small MLP layers.
         if optimizer_name.lower() == 'adam':
-            optimizer = optim.Adam(model.parameters(), lr=learning_rate)
+            optimizer = optim.Adam(model.parameters(), lr=learning_rate,
+                                   fused=device.type == "cuda")
         else:
-            optimizer = optim.SGD(model.parameters(), lr=learning_rate, 
-                                  momentum=config.get('momentum', 0.5))
+            optimizer = optim.SGD(model.parameters(), lr=learning_rate,
+                                  momentum=config.get('momentum', 0.5),
+                                  foreach=True)
         
+        # Gradient scaler for mixed-precision training (disabled on CPU)
+        scaler = torch.cuda.amp.GradScaler(enabled=device.type == "cuda")
+
         # Setup scheduler if needed
         if config.get('use_scheduler', False):
             scheduler = optim.lr_scheduler.ReduceLROnPlateau(
@@ -166,10 +232,11 @@ def train_model(model, job_id, config, status_callback=None):
         for epoch in range(1, epochs + 1):
             # Train epoch
             epoch_results = train_epoch(
-                model, train_loader, optimizer, epoch, job_id, status_callback)
-            
+                model, train_data, train_targets, batch_size, optimizer, scaler,
+                epoch, job_id, status_callback)
+
             # Validate
-            val_results = validate(model, test_loader)
+            val_results = validate(model, test_data, test_targets, batch_size)
             
             # Save results to history
             history['train_loss'].append(epoch_results['loss'])